@@ -11,7 +11,14 @@ from matplotlib import colors
 import matplotlib as mpl
 import numpy as np
 #-
-from kmeans.base_funcs import _assign_clusters, _validate, _new_centroids, SMALLEST_THRESH
+from kmeans.base_funcs import (
+    _centroids_from_labels,
+    _group_clusters,
+    _label_points,
+    _validate,
+    SMALLEST_THRESH,
+    SMALLEST_THRESH_F32,
+)
 from kmeans.clustering import MaxIterationError
 
 
@@ -23,8 +30,37 @@ colors: list = [color for color in colors.TABLEAU_COLORS.values()]
 WRAP_FACTOR: int = len(colors)
 SZ = 10
 CENTROID_SZ = 2*SZ
+# Per-cluster cap on points handed to the canvas each frame.
+MAX_PLOT_POINTS = 100000
+
+# Legend labels and wrapped colors, cached per cluster count.
+_STYLE_CACHE: dict[int, tuple[tuple, tuple]] = {}
+
+
+def _cluster_styles(k: int) -> tuple[tuple, tuple]:
+    """Returns the (labels, colors) pair used to style a k-cluster plot
+
+    Args:
+        k: Amount of clusters plotted.
+
+    Returns:
+        tuple, tuple: Legend labels and plot colors, one entry per cluster
+
+    """
+    try:
+        return _STYLE_CACHE[k]
+    except KeyError:
+        styles = (
+            tuple('Cluster {}'.format(i) for i in range(k)),
+            tuple(colors[i % WRAP_FACTOR] for i in range(k)),
+        )
+        _STYLE_CACHE[k] = styles
+        return styles
+
+
 def _draw(
-        clusters: Clusters,
+        data: Clusterable,
+        labels: np.ndarray,
         centroids: Clusterable,
         ax_obj: mpl.axes.Axes,
         ndim: int,
@@ -32,9 +68,10 @@ def _draw(
         legend_loc: str = "best"
 ) -> None:
     """Draws the clusters onto the figure
-    
+
     Args:
-        clusters: The segmented data
+        data: The data being clustered
+        labels: The label (centroid index) for each data element
         centroids: The centers of the clusters
         ax_obj: The axes object (from the figure)
         ndim: The number of dimensions
@@ -43,50 +80,69 @@ def _draw(
     Returns:
         None
     """
-    k = len(clusters)
-    ax_obj.clear()
-    # Get the data
-    labels = ['Cluster {}'.format(i) for i in range(k)]
-
-    ax_obj.grid(which="both")
-    ax_obj.set(xlabel="X", ylabel="Y", title=f"$k$ = ${k}$")
+    k = len(centroids)
+    # Build the scatter artists (and the legend/grid/labels) once; afterward,
+    # each frame only moves the existing artists instead of rebuilding the Axes.
+    artists = getattr(ax_obj, "_cluster_artists", None)
+    if artists is None:
+        legend_labels, cluster_colors = _cluster_styles(k)
+        ax_obj.grid(which="both")
+        ax_obj.set(xlabel="X", ylabel="Y", title=f"$k$ = ${k}$")
+        artists = []
+        for key in range(k):
+            if ndim == 2:
+                points = ax_obj.scatter(
+                    [], [],
+                    s=SZ, c=cluster_colors[key],
+                    label=legend_labels[key], zorder=3,
+                )
+                centroid = ax_obj.scatter(
+                    [], [],
+                    s=CENTROID_SZ, c=cluster_colors[key], edgecolors='k',
+                    zorder=3,
+                )
+            else:
+                points = ax_obj.scatter(
+                    [], [], [],
+                    s=SZ, c=cluster_colors[key],
+                    label=legend_labels[key], zorder=3,
+                )
+                centroid = ax_obj.scatter(
+                    [], [], [],
+                    s=CENTROID_SZ, c=cluster_colors[key], edgecolors='k',
+                    zorder=5,
+                )
+            artists.append((points, centroid))
+        ax_obj._cluster_artists = artists
+        # set_offsets/_offsets3d never touch the autoscaler, so register the
+        # data limits here; the dataset is fixed across frames, so once is
+        # enough.
+        if ndim == 2:
+            ax_obj.update_datalim(data[:, :2])
+            ax_obj.autoscale_view()
+        else:
+            ax_obj.auto_scale_xyz(data[:, 0], data[:, 1], data[:, 2])
+        ax_obj.legend(loc=legend_loc)
+        plt.show(block=False)
 
-    for key in clusters:
-        cluster = clusters[key]
+    for key in range(k):
+        cluster = data[labels == key]
+        if len(cluster) > MAX_PLOT_POINTS:
+            # Strided NumPy view; the animation doesn't need every point.
+            step = -(-len(cluster) // MAX_PLOT_POINTS)
+            cluster = cluster[::step]
+        points, centroid = artists[key]
         if ndim == 2:
-            x = cluster[:, 0]
-            y = cluster[:, 1]
-            cx, cy = centroids[key]
-
-            ax_obj.scatter(
-                x, y,
-                s=SZ, c=colors[key%WRAP_FACTOR],
-                label=labels[key], zorder=3,
-            )
-            ax_obj.scatter(
-                cx, cy,
-                s=CENTROID_SZ, c=colors[key%WRAP_FACTOR], edgecolors='k',
-                zorder=3,
-            ) 
+            points.set_offsets(cluster[:, :2])
+            centroid.set_offsets(centroids[key][np.newaxis, :2])
         else:
-            x = cluster[:, 0]
-            y = cluster[:, 1]
-            z = cluster[:, 2]
+            points._offsets3d = (cluster[:, 0], cluster[:, 1], cluster[:, 2])
             cx, cy, cz = centroids[key]
-            ax_obj.scatter(
-                x, y, z,
-                s=SZ, c=colors[key%WRAP_FACTOR],
-                label=labels[key], zorder=3,
-            )
-            ax_obj.scatter(
-                cx, cy, cz,
-                s=CENTROID_SZ, c=colors[key%WRAP_FACTOR], edgecolors='k',
-                zorder=5,
-            )
+            centroid._offsets3d = ([cx], [cy], [cz])
     else:
-        ax_obj.legend(loc=legend_loc)
-        plt.pause(0.01) 
-        plt.show(block=False)
+        fig = ax_obj.figure
+        fig.canvas.draw_idle()
+        fig.canvas.flush_events()
         return
 
 
@@ -135,13 +191,20 @@ def view_clustering(
         max_iterations=max_iterations
     )
 
+    # Single precision is plenty for a 2-D/3-D animation and halves the memory
+    # traffic of every assignment pass; tolerances below float32 resolution
+    # are clamped to its 20*eps floor.
+    data = np.ascontiguousarray(data, dtype=np.float32)
+    initial_means = np.ascontiguousarray(initial_means, dtype=np.float32)
+    tolerance = max(tolerance, SMALLEST_THRESH_F32)
+
     # Handle legend placement for large datasets
     if len(data) > 100000:
         legend_loc = 'upper right'
     else:
         legend_loc  = 'best'
 
-    clusters, old_centroids = {}, initial_means
+    old_centroids = initial_means
     # 2D or 3D plots?
     if ndim==2:
         fig, ax = plt.subplots()
@@ -154,16 +217,20 @@ def view_clustering(
             "Use the `cluster` function for other dimensioned data."
         )
 
+    # Iterate on a flat label array; the Clusters structure is only built once
+    # the centroids settle.
     for _ in range(max_iterations):
-        clusters = _assign_clusters(data, old_centroids)
-        centroids = _new_centroids(clusters, ndim)
-        _draw(clusters, centroids, ax, ndim, legend_loc=legend_loc)
-        changes = np.linalg.norm(centroids - old_centroids, axis=1)  # Distance along each vector
-        if any(np.where(changes > tolerance, True, False)):
+        labels = _label_points(data[..., :ndim], old_centroids)
+        centroids = _centroids_from_labels(data, labels, k, ndim)
+        _draw(data, labels, centroids, ax, ndim, legend_loc=legend_loc)
+        # Compare squared distances to avoid the sqrt; same decision either way.
+        diffs = centroids - old_centroids
+        changes = np.einsum('ij,ij->i', diffs, diffs)
+        if np.any(changes > tolerance*tolerance):
             old_centroids = centroids
         else:
             ax = fig.get_axes()[0]
             ax.set(title=f"Clustering @ $k$=${k}$")
-            return clusters, centroids, fig
+            return _group_clusters(data, labels, k), centroids, fig
     else:
         raise MaxIterationError("Iteration count exceeded.")            
@@ -10,12 +10,22 @@ from typing import Callable, Union
 #-
 import numpy as np
 
-Clusterable = np.ndarray 
+# Numba is optional (install with the ``fast`` extra); without it the
+# clustering falls back to pure-NumPy kernels.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+Clusterable = np.ndarray
 Clusters = dict[int, Clusterable]
 
-# A la Peter Corke's spatialmath, this sets the smallest value in which an element can change. 
+# A la Peter Corke's spatialmath, this sets the smallest value in which an element can change.
 _eps = np.finfo(np.float64).eps
 SMALLEST_THRESH =  20*_eps
+# The equivalent floor for single-precision data.
+_eps32 = np.finfo(np.float32).eps
+SMALLEST_THRESH_F32 = 20*_eps32
 
 
 def time_func(func: Callable) -> Callable:
@@ -36,61 +46,136 @@ def time_func(func: Callable) -> Callable:
     return wrapper
 
 
-#@time_func 
+def _label_points(points: Clusterable, centroids: np.ndarray) -> np.ndarray:
+    """Finds the index of the nearest centroid for each point
+
+    Args:
+        points: The data to be labeled (row vectors).
+        centroids: The current cluster centroids.
+
+    Returns:
+        np.ndarray: The label (centroid index) for each point
+
+    """
+    if numba is not None:
+        # The 2-D/3-D cases (the only ones view_clustering animates) get
+        # unrolled kernels whose inner loops vectorize to SIMD.
+        ndim = centroids.shape[1]
+        if ndim == 2:
+            return _label_points_2d(points, centroids)
+        if ndim == 3:
+            return _label_points_3d(points, centroids)
+        return _label_points_jit(points, centroids)
+    # ||x - c||^2 = ||x||^2 - 2*x.c + ||c||^2. The ||x||^2 term is constant
+    # per point and cannot change the argmin, so the N x k distance ranking
+    # reduces to one BLAS matmul plus the k centroid norms -- far cheaper
+    # than broadcasting the N x k x d difference tensor.
+    # The expression stays out-of-place so integer-typed data promotes to
+    # float instead of tripping an in-place cast error.
+    c_sqnorm = np.einsum('ij,ij->i', centroids, centroids)
+    dists = c_sqnorm - 2.0*(points @ centroids.T)
+    # On ties, `np.argmin` selects the first (lowest-indexed) centroid.
+    return np.argmin(dists, axis=1)
+
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _label_points_jit(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        n = points.shape[0]
+        k, ndim = centroids.shape
+        labels = np.empty(n, dtype=np.int64)
+        for i in numba.prange(n):
+            best = 0
+            best_dist = np.inf
+            for c in range(k):
+                dist = 0.0
+                for d in range(ndim):
+                    diff = points[i, d] - centroids[c, d]
+                    dist += diff * diff
+                if dist < best_dist:
+                    best_dist = dist
+                    best = c
+            labels[i] = best
+        return labels
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _label_points_2d(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        n = points.shape[0]
+        k = centroids.shape[0]
+        labels = np.empty(n, dtype=np.int64)
+        for i in numba.prange(n):
+            px = points[i, 0]
+            py = points[i, 1]
+            best = 0
+            best_dist = np.inf
+            for c in range(k):
+                dx = px - centroids[c, 0]
+                dy = py - centroids[c, 1]
+                dist = dx*dx + dy*dy
+                if dist < best_dist:
+                    best_dist = dist
+                    best = c
+            labels[i] = best
+        return labels
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _label_points_3d(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        n = points.shape[0]
+        k = centroids.shape[0]
+        labels = np.empty(n, dtype=np.int64)
+        for i in numba.prange(n):
+            px = points[i, 0]
+            py = points[i, 1]
+            pz = points[i, 2]
+            best = 0
+            best_dist = np.inf
+            for c in range(k):
+                dx = px - centroids[c, 0]
+                dy = py - centroids[c, 1]
+                dz = pz - centroids[c, 2]
+                dist = dx*dx + dy*dy + dz*dz
+                if dist < best_dist:
+                    best_dist = dist
+                    best = c
+            labels[i] = best
+        return labels
+
+
+def _group_clusters(data: Clusterable, labels: np.ndarray, k: int) -> Clusters:
+    """Groups the data by label into the Clusters structure
+
+    Args:
+        data: The labeled data.
+        labels: The label (centroid index) for each data element.
+        k: Amount of clusters.
+
+    Returns:
+        dict[int, np.ndarray]: The Clusters
+
+    """
+    # One stable sort of the labels, then split the reordered data at each
+    # label boundary.
+    order = np.argsort(labels, kind='stable')
+    sorted_data = data[order]
+    bounds = np.searchsorted(labels[order], np.arange(k + 1))
+    return {i: sorted_data[bounds[i]:bounds[i + 1]] for i in range(k)}
+
+
+#@time_func
 def _assign_clusters(data: Clusterable, centroids: np.ndarray) -> Clusters:
     """Assigns each data element to a cluster
-    
+
     Args:
         data: The data to be labeled.
         centroids: The given information to use as cluster criteria.
 
     Returns:
-        dict[int, np.ndarray]: The Clusters 
-    
-    """    
-    k, ndim, *_ = centroids.shape
-    temp_data = data[..., :ndim]
-    vecs = temp_data[:, np.newaxis] - centroids[np.newaxis, ...]
-    norms = np.linalg.norm(vecs, axis=-1)
-
-    # Handle the case in which a given data point is equivalently close to multiple centroids.
-    '''
-    Step 1: For each given set of norms, find where the elements are equal to the minimum of that set.
-        Ex. [12, 2, 3, 2] --> [False, True, False, True]
-        eq = np.equal(norms, np.min(norms, axis=1)[:, np.newaxis])
-    Step 2: Find where the elements are True using `np.nonzero`  (call the resulting structure `p`). 
-        This gives the indices of each True value: 
-        `p = np.nonzero(eq)  # (y_indices: np.ndarray, x_indices: np.ndarray)`
-    Step 3: For the y_indices (the top level indices), call `np.unique` and return the indices needed to perform the operation. 
-        _, idxs = np.unique(p[0], return_index=True)
-    Step 4: Now, generate the y and x indices needed to construct the array with only one nonzero term in each element:
-        y = p[0][idxs]
-        x = p[1][idxs]
-    Step 5: Create a zero matrix and fill it with ones in the proper place
-        labels = np.zeros(norms.shape)
-        labels[y, x] = 1
-    Step 6: Now, we can find the nonzero elements of this structure and proceed
-        to find the label values for each data element. 
-    '''
-    broadcastable = np.min(norms, axis=1)[:, np.newaxis]
-    nz = np.nonzero(np.equal(norms, broadcastable))
-    _, idxs = np.unique(nz, return_index=True)
-    y = nz[0][idxs]
-    x = nz[1][idxs]
-    labels = np.zeros(norms.shape)
-    labels[y, x] = 1
-    
-    # Get the data labels and create the Clusters structure
-    indices = np.nonzero(labels)
-    labels = indices[1].reshape(-1, 1)
-    labeled = np.concatenate((data, labels), axis=-1)
-    labeled = labeled[labeled[:, -1].argsort()]  # https://stackoverflow.com/questions/2828059/sorting-arrays-in-numpy-by-column
-    clusters = {i: None for i in range(k)}
-    for i in range(k):
-        arr = labeled[labeled[:, -1] == i]
-        clusters[i] = arr[:, :-1]
+        dict[int, np.ndarray]: The Clusters
 
-    return clusters
+    """
+    k, ndim, *_ = centroids.shape
+    labels = _label_points(data[..., :ndim], centroids)
+    return _group_clusters(data, labels, k)
 
 
 #@time_func
@@ -114,7 +199,7 @@ def _generate_means(data: Clusterable, k: int, ndim:int) -> np.ndarray:
 
 
     while count < COUNT_OUT:
-        indices = np.random.choice(np.arange(len(data)), size=(k,), replace=False) 
+        indices = np.random.choice(len(data), size=(k,), replace=False)
         means = data[indices, :ndim]
         if len(np.unique(means, axis=0)) == len(means):
             return np.array(means)
@@ -135,14 +220,43 @@ def _new_centroids(clusters: Clusters, ndim: int) -> np.ndarray:
         np.ndarray: New Centroids
     
     """
-    # If this becomes a bottleneck, replace the `for` loop with a list comp.
-    centroids = []
-    for key in clusters:
-        cluster = clusters[key]
-        avg = np.average(cluster[:, :ndim], axis=0)
-        centroids.append(avg)
-    else:
-        return np.array(centroids)
+    centroids = [np.average(clusters[key][:, :ndim], axis=0) for key in clusters]
+    return np.array(centroids)
+
+
+def _centroids_from_labels(
+        data: Clusterable,
+        labels: np.ndarray,
+        k: int,
+        ndim: int,
+) -> np.ndarray:
+    """Returns a new set of centroids from labeled data
+
+    The label-array counterpart to :func:`_new_centroids`; it averages each
+    label group in place without copying the data into Clusters first.
+
+    Args:
+        data: The data being clustered
+        labels: The label (centroid index) for each data element
+        k: Amount of clusters
+        ndim: Dimension of data we are clustering
+
+    Returns:
+        np.ndarray: New Centroids
+
+    """
+    points = data[..., :ndim]
+    sums = np.empty((k, ndim))
+    for d in range(ndim):
+        sums[:, d] = np.bincount(labels, weights=points[:, d], minlength=k)
+    counts = np.bincount(labels, minlength=k)
+    centroids = sums / counts[:, np.newaxis]
+    # Match floating-point data's precision (np.bincount accumulates in
+    # float64) so e.g. a float32 pipeline stays float32 end to end; integer
+    # data keeps full-precision centroids.
+    if np.issubdtype(data.dtype, np.floating):
+        centroids = centroids.astype(data.dtype, copy=False)
+    return centroids
 
 
 #@time_func
@@ -229,11 +343,8 @@ def _validate(
                 raise ValueError(f"Initial means item not among provided data: {centroid}")
         """
         # Check for duplicates
-        filtered_initial_means, ndx = np.unique(
-            np.copy(temp_means),  # use copy so original array order remains the same.
-            axis=0,
-            return_index=True
-        )
+        # np.unique sorts into a new array; temp_means itself is untouched.
+        filtered_initial_means, ndx = np.unique(temp_means, axis=0, return_index=True)
         # Check length
         try:
             assert len(filtered_initial_means) == k
@@ -242,4 +353,7 @@ def _validate(
     return new_data, temp_means, ndim
 
 validate = _validate
-__all__ = ["_assign_clusters", "_validate", "_new_centroids", "_generate_means"]
+__all__ = [
+    "_assign_clusters", "_validate", "_new_centroids", "_generate_means",
+    "_label_points", "_group_clusters", "_centroids_from_labels",
+]
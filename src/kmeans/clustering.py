@@ -9,7 +9,13 @@ from typing import Union
 #-
 import numpy as np
 #-
-from kmeans.base_funcs import _assign_clusters, _validate, _new_centroids, SMALLEST_THRESH
+from kmeans.base_funcs import (
+    _centroids_from_labels,
+    _group_clusters,
+    _label_points,
+    _validate,
+    SMALLEST_THRESH,
+)
 
 
 Clusterable = np.ndarray
@@ -75,15 +81,19 @@ def cluster(
         tolerance=tolerance, 
         max_iterations=max_iterations
     )
-    clusters, old_centroids = {}, initial_means
+    old_centroids = initial_means
 
+    # Iterate on a flat label array; the Clusters structure is only built once
+    # the centroids settle.
     for _ in range(max_iterations):
-        clusters = _assign_clusters(data, old_centroids)
-        centroids = _new_centroids(clusters, ndim)
-        changes = np.linalg.norm(centroids - old_centroids, axis=1)  # Distance along each vector
-        if any(np.where(changes > tolerance, True, False)):
+        labels = _label_points(data[..., :ndim], old_centroids)
+        centroids = _centroids_from_labels(data, labels, k, ndim)
+        # Compare squared distances to avoid the sqrt; same decision either way.
+        diffs = centroids - old_centroids
+        changes = np.einsum('ij,ij->i', diffs, diffs)
+        if np.any(changes > tolerance*tolerance):
             old_centroids = centroids
         else:
-            return clusters, centroids
+            return _group_clusters(data, labels, k), centroids
     else:
         raise MaxIterationError("Iteration count exceeded.")            
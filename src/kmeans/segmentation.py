@@ -5,26 +5,32 @@
 #@description:
 #    Perform semantic segmentation on the provided image.
 #=============================================================================
-import itertools
-#-
 import numpy as np
 #-
 from kmeans import cluster
 
 
+# The pixel-coordinate grid only depends on the image's height and width, so
+# it is cached and shared between same-sized images. The grid is only ever
+# read (np.concatenate copies it), so no invalidation is needed.
+_coord_cache: dict[tuple[int, int], np.ndarray] = {}
+
+
 def _append_coords(img: np.ndarray) -> np.ndarray:
     """Append each pixel's coordinate to itself.
-    
+
     Args:
         img: The image.
-    
+
     Returns:
         np.ndarray: Array with appended indices.
 
     """
     height, width, *rest = img.shape
-    indices = list(itertools.product(range(height), range(width)))
-    indices = np.array(indices).reshape(height, width, -1)
+    indices = _coord_cache.get((height, width))
+    if indices is None:
+        indices = np.indices((height, width)).transpose(1, 2, 0)
+        _coord_cache[(height, width)] = indices
     return np.concatenate((img, indices), axis=-1)
 
 
@@ -58,19 +64,19 @@ def segment_img(img: np.ndarray, groups: int, random_colors: bool = False) -> np
        [ 3,  4,  5],
        [ 6,  7, 10]])
     '''
-    seg_img = np.zeros(shape=img.shape).astype(np.uint8)
+    seg_img = np.zeros(shape=img.shape, dtype=np.uint8)
     if random_colors:
         for key in color_groups:
             pixels_and_coords = color_groups[key]
-            color = np.random.randint(0, 256, size=3).astype(np.uint8) 
-            idxs = np.array([arr[-2:] for arr in pixels_and_coords])
+            color = np.random.randint(0, 256, size=3).astype(np.uint8)
+            idxs = pixels_and_coords[:, -2:].astype(int)
             y, x = idxs[:, 0], idxs[:, 1]
             seg_img[y, x] = color
     else:
         for key in color_groups:
             pixels_and_coords = color_groups[key]
             color = group_colors[key].astype(np.uint8)
-            idxs = np.array([arr[-2:] for arr in pixels_and_coords])
+            idxs = pixels_and_coords[:, -2:].astype(int)
             y, x = idxs[:, 0], idxs[:, 1]
             seg_img[y, x] = color
     return seg_img
\ No newline at end of file
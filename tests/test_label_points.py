@@ -0,0 +1,46 @@
+"""
+@author: tjdwill
+@description:
+    Test the point-labeling kernel, including the pure-NumPy fallback
+    used when Numba is not installed.
+"""
+import numpy as np
+#-
+import kmeans.base_funcs as bf
+from kmeans.base_funcs import _label_points
+
+
+SEED = 27
+np.random.seed(SEED)
+
+K = 4
+N = 1000
+
+
+def brute_force(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Reference labeling: argmin over directly computed distances."""
+    vecs = points[:, np.newaxis] - centroids[np.newaxis, ...]
+    return np.argmin(np.linalg.norm(vecs, axis=-1), axis=1)
+
+
+data = np.random.random((N, 3))
+centroids = data[:K].copy()
+
+# Default path (jitted when the `fast` extra is installed).
+assert np.array_equal(_label_points(data, centroids), brute_force(data, centroids))
+
+# Force the pure-NumPy fallback. It must also handle integer-typed data
+# (e.g. pixel values with appended coordinates from segment_img).
+_numba = bf.numba
+bf.numba = None
+try:
+    assert np.array_equal(_label_points(data, centroids), brute_force(data, centroids))
+
+    int_data = np.random.randint(0, 256, size=(N, 5)).astype(np.int64)
+    int_centroids = int_data[:K].copy()
+    assert np.array_equal(
+        _label_points(int_data, int_centroids),
+        brute_force(int_data, int_centroids),
+    )
+finally:
+    bf.numba = _numba